@@ -53,7 +53,7 @@ class ToolExecutionActivity:
         logger: logging.Logger
     ) -> str:
         """Execute an MCP tool and return the observation."""
-        logger.debug(f"Executing MCP tool: {tool_name}")
+        logger.debug("Executing MCP tool: %s", tool_name)
         
         # Get MCP configuration
         mcp_config = tool.get_mcp_config()
@@ -93,7 +93,7 @@ class ToolExecutionActivity:
         else:
             observation = str(result)
         
-        logger.debug(f"MCP tool result: {observation}")
+        logger.debug("MCP tool result: %s", observation)
         return observation
 
     def _execute_traditional_tool(
@@ -104,9 +104,9 @@ class ToolExecutionActivity:
         logger: logging.Logger
     ) -> str:
         """Execute a traditional tool and return the observation."""
-        logger.debug(f"Executing traditional tool: {tool_name}")
+        logger.debug("Executing traditional tool: %s", tool_name)
         result = tool.execute(**tool_args)
-        logger.debug(f"Tool result: {result}")
+        logger.debug("Tool result: %s", result)
         return str(result)
 
     @activity.defn
@@ -5,6 +5,7 @@ from .date_utils import (
     get_current_date,
     get_forecast_range,
     get_historical_range,
+    get_min_historical_date,
 )
 from .display import (
     Colors,
@@ -24,6 +25,7 @@ __all__ = [
     "get_current_date",
     "get_forecast_range",
     "get_historical_range",
+    "get_min_historical_date",
     "format_date_for_api",
     # Display utilities
     "Colors",
@@ -6,16 +6,46 @@ demonstrating clean async patterns for a modern Python application.
 No authentication required - just make requests and get data!
 """
 
+import time
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Union
 
 import httpx
+import orjson
+
+from .date_utils import ARCHIVE_DELAY
 
 # API Type Constants
 API_TYPE_FORECAST = "forecast"
 API_TYPE_ARCHIVE = "archive"
 API_TYPE_GEOCODING = "geocoding"
 
+# Maximum number of resolved locations kept per client
+COORDINATES_CACHE_SIZE = 1024
+
+# How long API responses are reused, in seconds. Forecasts refresh hourly
+# upstream; archive data for past dates doesn't change.
+RESPONSE_CACHE_TTL = {
+    API_TYPE_FORECAST: 15 * 60,
+    API_TYPE_ARCHIVE: 24 * 60 * 60,
+}
+RESPONSE_CACHE_SIZE = 256
+
+# Connection settings for the pooled HTTP client: fail fast when a host is
+# unreachable, but give slow responses the full 30 seconds
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=3.05)
+HTTP_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=8)
+# Retries apply to failed connection attempts only, never to sent requests
+HTTP_CONNECT_RETRIES = 2
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create an HTTP client with keep-alive pooling and connection retries."""
+    transport = httpx.AsyncHTTPTransport(
+        retries=HTTP_CONNECT_RETRIES, limits=HTTP_LIMITS
+    )
+    return httpx.AsyncClient(timeout=HTTP_TIMEOUT, transport=transport)
+
 
 # Helper function for servers
 async def get_coordinates(location: str) -> Optional[Dict[str, Union[str, float]]]:
@@ -23,9 +53,8 @@ async def get_coordinates(location: str) -> Optional[Dict[str, Union[str, float]
     Get coordinates for a location name.
     Returns dict with latitude, longitude, and name, or None if not found.
     """
-    client = OpenMeteoClient()
     try:
-        lat, lon = await client.get_coordinates(location)
+        lat, lon = await shared_client.get_coordinates(location)
         return {"latitude": lat, "longitude": lon, "name": location}
     except Exception:
         return None
@@ -77,10 +106,12 @@ class OpenMeteoClient:
         self.archive_url = "https://archive-api.open-meteo.com/v1/archive"
         self.geocoding_url = "https://geocoding-api.open-meteo.com/v1/search"
         self._client: Optional[httpx.AsyncClient] = None
+        self._coordinates_cache: Dict[str, Tuple[float, float]] = {}
+        self._response_cache: Dict[tuple, Tuple[float, Dict]] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._client = httpx.AsyncClient(timeout=30.0)
+        self._client = create_http_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -92,7 +123,7 @@ class OpenMeteoClient:
     async def ensure_client(self) -> httpx.AsyncClient:
         """Ensure we have an active client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = create_http_client()
         return self._client
 
     async def close(self):
@@ -102,7 +133,20 @@ class OpenMeteoClient:
             self._client = None
 
     async def get(self, api_type: str, params: Dict) -> Dict:
-        """Generic method to get data from Open-Meteo APIs."""
+        """
+        Generic method to get data from Open-Meteo APIs.
+
+        Identical requests within RESPONSE_CACHE_TTL reuse the previous response,
+        since agents often ask about the same place several times in a row.
+        """
+        ttl = RESPONSE_CACHE_TTL.get(api_type)
+        key = (api_type, tuple(sorted(params.items())))
+        if ttl is not None:
+            cached = self._response_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl:
+                # Callers annotate the response, so hand out a copy
+                return dict(cached[1])
+
         client = await self.ensure_client()
 
         if api_type == API_TYPE_FORECAST:
@@ -116,7 +160,17 @@ class OpenMeteoClient:
 
         response = await client.get(url, params=params)
         response.raise_for_status()
-        return response.json()
+        data = orjson.loads(response.content)
+
+        if ttl is not None:
+            # Re-insert expired entries at the end so eviction stays oldest-first
+            self._response_cache.pop(key, None)
+            if len(self._response_cache) >= RESPONSE_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._response_cache[next(iter(self._response_cache))]
+            self._response_cache[key] = (time.monotonic(), data)
+            return dict(data)
+        return data
 
     async def get_coordinates(self, location: str) -> Tuple[float, float]:
         """
@@ -134,10 +188,21 @@ class OpenMeteoClient:
         # Extract just the city name from formats like "City, State"
         city = location.split(",")[0].strip()
 
+        # Cities don't move, so skip the geocoding round-trip on repeat lookups
+        key = city.lower()
+        cached = self._coordinates_cache.get(key)
+        if cached is not None:
+            return cached
+
         results = await self.geocode(city, count=1)
         if results:
             loc = results[0]
-            return loc["latitude"], loc["longitude"]
+            coords = (loc["latitude"], loc["longitude"])
+            if len(self._coordinates_cache) >= COORDINATES_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._coordinates_cache[next(iter(self._coordinates_cache))]
+            self._coordinates_cache[key] = coords
+            return coords
 
         raise ValueError(f"Location '{location}' not found")
 
@@ -158,7 +223,7 @@ class OpenMeteoClient:
 
         response = await client.get(self.geocoding_url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get("results", [])
 
     async def get_forecast(
@@ -208,7 +273,7 @@ class OpenMeteoClient:
 
         response = await client.get(self.forecast_url, params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_historical(
         self,
@@ -259,7 +324,7 @@ class OpenMeteoClient:
 
         response = await client.get(self.archive_url, params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_weather_data(
         self,
@@ -305,7 +370,7 @@ class OpenMeteoClient:
             end_date = end_date.date()
 
         # Determine which API to use
-        archive_cutoff = today - timedelta(days=5)
+        archive_cutoff = today - ARCHIVE_DELAY
 
         if end_date <= archive_cutoff:
             # All dates are historical
@@ -340,3 +405,7 @@ class OpenMeteoClient:
                 past_days=min(past_days, 92),
                 timezone=timezone,
             )
+
+
+# Shared instance so every caller reuses one keep-alive connection pool
+shared_client = OpenMeteoClient()
@@ -1,6 +1,9 @@
 """Date utilities for Open-Meteo API data retrieval."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+
+# Open-Meteo archive data lags real time by this much
+ARCHIVE_DELAY = timedelta(days=5)
 
 
 def get_current_date():
@@ -44,11 +47,21 @@ def get_historical_range(days_back=30):
     """
     current = get_current_date()
     # Account for 5-day delay in archive data
-    end_date = current - timedelta(days=5)
+    end_date = current - ARCHIVE_DELAY
     start_date = end_date - timedelta(days=days_back)
     return start_date.date(), end_date.date()
 
 
+def get_min_historical_date():
+    """
+    Get the most recent date the archive API has data for.
+
+    Returns:
+        date: Today's date minus the archive delay
+    """
+    return date.today() - ARCHIVE_DELAY
+
+
 def format_date_for_api(date):
     """
     Format a date for Open-Meteo API.
@@ -64,21 +64,20 @@ def print_weather_summary(data: dict, location_name: str = "") -> None:
     if "daily" in data:
         daily = data["daily"]
         times = daily.get("time", [])
+        temp_max = daily.get("temperature_2m_max")
+        temp_min = daily.get("temperature_2m_min")
+        precip = daily.get("precipitation_sum")
 
         if times:
             print("\nDaily Forecast:")
             for i in range(min(5, len(times))):  # Show up to 5 days
-                date = times[i]
-                print(f"\n  {date}:")
+                print(f"\n  {times[i]}:")
 
-                if "temperature_2m_max" in daily and "temperature_2m_min" in daily:
-                    temp_max = daily["temperature_2m_max"][i]
-                    temp_min = daily["temperature_2m_min"][i]
-                    print(f"    Temperature: {temp_min}°C - {temp_max}°C")
+                if temp_max is not None and temp_min is not None:
+                    print(f"    Temperature: {temp_min[i]}°C - {temp_max[i]}°C")
 
-                if "precipitation_sum" in daily:
-                    precip = daily["precipitation_sum"][i]
-                    print(f"    Precipitation: {precip} mm")
+                if precip is not None:
+                    print(f"    Precipitation: {precip[i]} mm")
 
 
 def print_soil_conditions(data: dict) -> None:
@@ -137,17 +136,23 @@ def print_precipitation_summary(data: dict, period_name: str = "") -> None:
         precip_sums = daily.get("precipitation_sum", [])
 
         if times and precip_sums:
-            total_precip = sum(precip_sums)
+            # One pass for the total, the wettest day and the dry days
+            total_precip = 0
+            max_precip = precip_sums[0]
+            max_idx = 0
+            dry_days = 0
+            for i, p in enumerate(precip_sums):
+                total_precip += p
+                if p > max_precip:
+                    max_precip = p
+                    max_idx = i
+                if p == 0:
+                    dry_days += 1
             avg_precip = total_precip / len(precip_sums)
-            max_precip = max(precip_sums)
-            max_day = times[precip_sums.index(max_precip)]
 
             print(f"  Total: {total_precip:.1f} mm")
             print(f"  Average: {avg_precip:.1f} mm/day")
-            print(f"  Maximum: {max_precip:.1f} mm on {max_day}")
-
-            # Count dry days
-            dry_days = sum(1 for p in precip_sums if p == 0)
+            print(f"  Maximum: {max_precip:.1f} mm on {times[max_idx]}")
             print(f"  Dry days: {dry_days} out of {len(precip_sums)}")
 
 
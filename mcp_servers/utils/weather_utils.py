@@ -4,7 +4,7 @@ All the logic, none of the server boilerplate.
 """
 
 import os
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, Field
 
@@ -156,14 +156,15 @@ def create_location_info(coords: MockCoordinates) -> LocationInfo:
 from .api_client import (
     API_TYPE_FORECAST,
     API_TYPE_ARCHIVE,
-    OpenMeteoClient,
     get_coordinates,
     get_daily_params,
     get_hourly_params,
+    shared_client,
 )
+from .date_utils import get_min_historical_date
 
-# Single client instance
-client = OpenMeteoClient()
+# Single client instance, shared with geocoding lookups
+client = shared_client
 
 # Check if we're in mock mode using existing utility
 MOCK_MODE = is_mock_mode()
@@ -239,11 +240,11 @@ async def get_historical_data(request: HistoricalRequest) -> dict:
     """Get historical weather data."""
     try:
         # Pydantic has already validated dates and coordinates
-        start = datetime.strptime(request.start_date, "%Y-%m-%d").date()
-        end = datetime.strptime(request.end_date, "%Y-%m-%d").date()
+        start = date.fromisoformat(request.start_date)
+        end = date.fromisoformat(request.end_date)
 
         # Additional validation for historical data availability
-        min_date = date.today() - timedelta(days=5)
+        min_date = get_min_historical_date()
         if end > min_date:
             return {
                 "error": f"Historical data only available before {min_date}. Use forecast API for recent dates."
@@ -383,7 +384,7 @@ async def get_agricultural_data(request: AgriculturalRequest) -> dict:
 # Mock data generation functions
 def _get_mock_forecast(coords: MockCoordinates, days: int) -> dict:
     """Return mock forecast data for testing."""
-    base_date = datetime.now()
+    start = date.today()
     time_list = []
     temperature_2m_max = []
     temperature_2m_min = []
@@ -391,8 +392,7 @@ def _get_mock_forecast(coords: MockCoordinates, days: int) -> dict:
     wind_speed_10m_max = []
     
     for i in range(days):
-        date = base_date + timedelta(days=i)
-        time_list.append(date.strftime("%Y-%m-%d"))
+        time_list.append((start + timedelta(days=i)).isoformat())
         temperature_2m_max.append(20 + i * 0.5)
         temperature_2m_min.append(10 + i * 0.3)
         precipitation_sum.append(0 if i % 3 else 2.5)
@@ -427,8 +427,8 @@ def _get_mock_forecast(coords: MockCoordinates, days: int) -> dict:
 
 def _get_mock_historical(coords: MockCoordinates, start_date: str, end_date: str) -> dict:
     """Return mock historical weather data for testing."""
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
     days = (end - start).days + 1
     
     time_list = []
@@ -438,8 +438,7 @@ def _get_mock_historical(coords: MockCoordinates, start_date: str, end_date: str
     rain_sum = []
     
     for i in range(days):
-        date_str = (start + timedelta(days=i)).strftime("%Y-%m-%d")
-        time_list.append(date_str)
+        time_list.append((start + timedelta(days=i)).isoformat())
         temperature_2m_max.append(22 + i * 0.3)
         temperature_2m_min.append(12 + i * 0.2)
         precipitation_sum.append(0 if i % 4 else 5.2)
@@ -465,7 +464,7 @@ def _get_mock_historical(coords: MockCoordinates, start_date: str, end_date: str
 
 def _get_mock_agricultural(coords: MockCoordinates, days: int, crop_type: Optional[str]) -> dict:
     """Return mock agricultural weather data for testing."""
-    base_date = datetime.now()
+    start = date.today()
     time_list = []
     soil_moisture_0_to_10cm = []
     soil_moisture_10_to_30cm = []
@@ -473,8 +472,7 @@ def _get_mock_agricultural(coords: MockCoordinates, days: int, crop_type: Option
     precipitation_sum = []
     
     for i in range(days):
-        date = base_date + timedelta(days=i)
-        time_list.append(date.strftime("%Y-%m-%d"))
+        time_list.append((start + timedelta(days=i)).isoformat())
         soil_moisture_0_to_10cm.append(25.5 + i * 0.2)
         soil_moisture_10_to_30cm.append(28.3 + i * 0.15)
         evapotranspiration.append(3.2 + i * 0.1)
@@ -5,10 +5,17 @@ These models provide automatic type coercion and validation for tool inputs,
 specifically handling the case where AWS Bedrock passes coordinates as strings.
 """
 
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 
 class LocationInput(BaseModel):
@@ -20,53 +27,40 @@ class LocationInput(BaseModel):
     converts these to the correct type.
     """
 
+    # Requests are read-only once validated; whitespace is trimmed in pydantic-core
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+
     location: Optional[str] = Field(
         None,
         description="Location name (e.g., 'Chicago, IL'). Slower due to geocoding.",
     )
     latitude: Optional[float] = Field(
-        None, description="Direct latitude (-90 to 90). PREFERRED for faster response."
+        None,
+        ge=-90,
+        le=90,
+        description="Direct latitude (-90 to 90). PREFERRED for faster response.",
     )
     longitude: Optional[float] = Field(
         None,
+        ge=-180,
+        le=180,
         description="Direct longitude (-180 to 180). PREFERRED for faster response.",
     )
 
-    @field_validator("latitude")
-    @classmethod
-    def validate_latitude(cls, v):
-        """Validate latitude is within valid range."""
-        if v is not None:
-            # Handle string input that might have extra characters
-            if isinstance(v, str):
-                # Remove any quotes or extra characters
-                v = v.strip("\"'")
-                try:
-                    v = float(v)
-                except ValueError:
-                    raise ValueError(f"Invalid latitude format: {v}")
-
-            if not -90 <= v <= 90:
-                raise ValueError(f"Latitude must be between -90 and 90, got {v}")
-        return v
-
-    @field_validator("longitude")
+    @field_validator("latitude", "longitude", mode="before")
     @classmethod
-    def validate_longitude(cls, v):
-        """Validate longitude is within valid range."""
-        if v is not None:
-            # Handle string input that might have extra characters
-            if isinstance(v, str):
-                # Remove any quotes or extra characters
-                v = v.strip("\"'")
-                try:
-                    v = float(v)
-                except ValueError:
-                    raise ValueError(f"Invalid longitude format: {v}")
-
-            if not -180 <= v <= 180:
-                raise ValueError(f"Longitude must be between -180 and 180, got {v}")
-        return v
+    def clean_coordinate(cls, v, info: ValidationInfo):
+        """Convert string coordinates to floats; range checks live on the fields."""
+        # Fast path: tool args from the agent are usually numbers already
+        if not isinstance(v, str):
+            return v
+        # Remove any quotes or extra characters (str_strip_whitespace only
+        # applies to str fields, not strings coerced into these float fields)
+        v = v.strip(" \"'")
+        try:
+            return float(v)
+        except ValueError:
+            raise ValueError(f"Invalid {info.field_name} format: {v}")
 
     @model_validator(mode="after")
     def check_at_least_one_location(self):
@@ -104,8 +98,10 @@ class HistoricalRequest(LocationInput):
     @classmethod
     def validate_date_format(cls, v):
         """Validate date format and parse to ensure it's valid."""
+        # The field pattern already guarantees YYYY-MM-DD, so the much faster
+        # ISO parser is equivalent to strptime here
         try:
-            datetime.strptime(v, "%Y-%m-%d")
+            date.fromisoformat(v)
         except ValueError:
             raise ValueError(f"Invalid date format: {v}. Use YYYY-MM-DD.")
         return v
@@ -113,11 +109,10 @@ class HistoricalRequest(LocationInput):
     @model_validator(mode="after")
     def validate_date_order(self):
         """Ensure end date is after start date."""
-        if self.start_date and self.end_date:
-            start = datetime.strptime(self.start_date, "%Y-%m-%d").date()
-            end = datetime.strptime(self.end_date, "%Y-%m-%d").date()
-            if end < start:
-                raise ValueError("End date must be after start date.")
+        # Both dates are validated, fixed-width YYYY-MM-DD strings, which
+        # compare in date order without being parsed again
+        if self.start_date and self.end_date and self.end_date < self.start_date:
+            raise ValueError("End date must be after start date.")
         return self
 
 
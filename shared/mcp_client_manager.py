@@ -19,17 +19,24 @@ class MCPClientManager:
         self, server_def: MCPServerDefinition | Dict[str, Any] | None
     ) -> Client:
         """Return existing client or create new one, keyed by server definition hash"""
+        key = self._get_server_key(server_def)
+
+        # Fast path: reuse an established client without waiting on the lock
+        client = self._clients.get(key)
+        if client is not None:
+            activity.logger.debug(
+                "Reusing existing MCP client for %s",
+                self._get_server_name(server_def),
+            )
+            return client
+
         async with self._lock:
-            key = self._get_server_key(server_def)
+            # Another caller may have connected while we waited
             if key not in self._clients:
                 await self._create_client(server_def, key)
                 activity.logger.info(
                     f"Created new MCP client for {self._get_server_name(server_def)}"
                 )
-            else:
-                activity.logger.info(
-                    f"Reusing existing MCP client for {self._get_server_name(server_def)}"
-                )
             return self._clients[key]
 
     def _get_server_key(
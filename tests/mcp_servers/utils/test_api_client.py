@@ -0,0 +1,116 @@
+"""Tests for the Open-Meteo API client."""
+import pytest
+
+from mcp_servers.utils.api_client import (
+    API_TYPE_FORECAST,
+    HTTP_TIMEOUT,
+    RESPONSE_CACHE_TTL,
+    OpenMeteoClient,
+)
+
+
+class TestGetCoordinates:
+    """Tests for coordinate lookup caching."""
+
+    async def test_repeat_lookups_reuse_cached_coordinates(self, monkeypatch):
+        """Test that the same city is only geocoded once."""
+        client = OpenMeteoClient()
+        calls = []
+
+        async def fake_geocode(name, count=10):
+            calls.append(name)
+            return [{"latitude": 41.8781, "longitude": -87.6298}]
+
+        monkeypatch.setattr(client, "geocode", fake_geocode)
+
+        first = await client.get_coordinates("Chicago, IL")
+        second = await client.get_coordinates("chicago")
+
+        assert first == second == (41.8781, -87.6298)
+        assert calls == ["Chicago"]
+
+    async def test_unknown_location_is_not_cached(self, monkeypatch):
+        """Test that failed lookups are retried rather than cached."""
+        client = OpenMeteoClient()
+        calls = []
+
+        async def fake_geocode(name, count=10):
+            calls.append(name)
+            return []
+
+        monkeypatch.setattr(client, "geocode", fake_geocode)
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                await client.get_coordinates("Atlantis")
+
+        assert calls == ["Atlantis", "Atlantis"]
+
+
+class TestResponseCache:
+    """Tests for reuse of identical API responses."""
+
+    def _fake_http(self, client, monkeypatch):
+        """Replace the HTTP client with one that records requests."""
+        calls = []
+
+        class FakeResponse:
+            content = b'{"daily": {"time": ["2025-01-01"]}}'
+
+            def raise_for_status(self):
+                pass
+
+        class FakeHttpClient:
+            async def get(self, url, params=None):
+                calls.append((url, params))
+                return FakeResponse()
+
+        async def fake_ensure_client():
+            return FakeHttpClient()
+
+        monkeypatch.setattr(client, "ensure_client", fake_ensure_client)
+        return calls
+
+    async def test_identical_requests_hit_the_api_once(self, monkeypatch):
+        """Test a repeated request is served from the cache."""
+        client = OpenMeteoClient()
+        calls = self._fake_http(client, monkeypatch)
+        params = {"latitude": 41.88, "longitude": -87.63, "forecast_days": 3}
+
+        first = await client.get(API_TYPE_FORECAST, params)
+        first["summary"] = "annotated by caller"
+        second = await client.get(API_TYPE_FORECAST, dict(params))
+
+        assert len(calls) == 1
+        assert "summary" not in second
+
+    async def test_expired_responses_are_refetched(self, monkeypatch):
+        """Test entries older than the TTL are not reused."""
+        client = OpenMeteoClient()
+        calls = self._fake_http(client, monkeypatch)
+        params = {"latitude": 41.88, "longitude": -87.63, "forecast_days": 3}
+
+        await client.get(API_TYPE_FORECAST, params)
+        # Backdate the cached entry past its TTL
+        for key, (stored_at, data) in client._response_cache.items():
+            client._response_cache[key] = (
+                stored_at - RESPONSE_CACHE_TTL[API_TYPE_FORECAST] - 1,
+                data,
+            )
+        await client.get(API_TYPE_FORECAST, params)
+
+        assert len(calls) == 2
+
+
+class TestHttpClient:
+    """Tests for the pooled HTTP client configuration."""
+
+    async def test_client_uses_split_timeouts(self):
+        """Test connection attempts time out sooner than reads."""
+        client = OpenMeteoClient()
+        http_client = await client.ensure_client()
+
+        assert http_client.timeout.connect == HTTP_TIMEOUT.connect
+        assert http_client.timeout.connect < http_client.timeout.read
+        assert await client.ensure_client() is http_client
+        await client.close()
@@ -0,0 +1,83 @@
+import pytest
+from pydantic import ValidationError
+
+from models.mcp_models import ForecastRequest, HistoricalRequest
+
+
+class TestLocationInput:
+    """Test coordinate coercion on the MCP request models"""
+
+    def test_float_coordinates_pass_through(self):
+        """Test float coordinates are accepted unchanged"""
+        request = ForecastRequest(latitude=41.8781, longitude=-87.6298)
+
+        assert request.latitude == 41.8781
+        assert request.longitude == -87.6298
+
+    def test_quoted_string_coordinates_are_converted(self):
+        """Test string coordinates with quotes and whitespace are converted"""
+        request = ForecastRequest(latitude='"41.8781"', longitude=" -87.6298 ")
+
+        assert request.latitude == 41.8781
+        assert request.longitude == -87.6298
+
+    def test_out_of_range_coordinates_rejected(self):
+        """Test latitude and longitude bounds are enforced"""
+        with pytest.raises(ValidationError):
+            ForecastRequest(latitude=91.0, longitude=0.0)
+
+        with pytest.raises(ValidationError):
+            ForecastRequest(latitude="0", longitude="-181")
+
+    def test_invalid_coordinate_string_rejected(self):
+        """Test non-numeric coordinate strings are rejected"""
+        with pytest.raises(ValidationError):
+            ForecastRequest(latitude="north", longitude=0.0)
+
+
+class TestHistoricalRequest:
+    """Test date validation on HistoricalRequest"""
+
+    def test_valid_date_range(self):
+        """Test a well-formed date range is accepted"""
+        request = HistoricalRequest(
+            latitude=41.8781,
+            longitude=-87.6298,
+            start_date="2025-01-01",
+            end_date="2025-01-07",
+        )
+
+        assert request.start_date == "2025-01-01"
+        assert request.end_date == "2025-01-07"
+
+    def test_impossible_date_rejected(self):
+        """Test dates that match the pattern but don't exist are rejected"""
+        with pytest.raises(ValidationError, match="Invalid date format"):
+            HistoricalRequest(
+                latitude=41.8781,
+                longitude=-87.6298,
+                start_date="2025-02-30",
+                end_date="2025-03-01",
+            )
+
+    def test_end_before_start_rejected(self):
+        """Test end date must not precede start date"""
+        with pytest.raises(ValidationError, match="End date must be after"):
+            HistoricalRequest(
+                latitude=41.8781,
+                longitude=-87.6298,
+                start_date="2025-01-07",
+                end_date="2025-01-01",
+            )
+
+    def test_surrounding_whitespace_is_stripped(self):
+        """Test padded location and date strings are trimmed before validation"""
+        request = HistoricalRequest(
+            location="  Chicago, IL ",
+            start_date=" 2025-01-01",
+            end_date="2025-01-07 ",
+        )
+
+        assert request.location == "Chicago, IL"
+        assert request.start_date == "2025-01-01"
+        assert request.end_date == "2025-01-07"
@@ -0,0 +1,32 @@
+"""Tests for MCP client pooling."""
+import asyncio
+
+from models.tool_definitions import MCPServerDefinition
+from shared.mcp_client_manager import MCPClientManager
+
+
+class TestMCPClientManager:
+    """Tests for MCPClientManager client reuse."""
+
+    async def test_concurrent_callers_share_one_client(self, monkeypatch):
+        """Test that concurrent and repeat lookups create a single client."""
+        manager = MCPClientManager()
+        created = []
+
+        async def fake_create_client(server_def, key):
+            created.append(key)
+            await asyncio.sleep(0)  # let the other callers queue on the lock
+            manager._clients[key] = object()
+
+        monkeypatch.setattr(manager, "_create_client", fake_create_client)
+        server_def = MCPServerDefinition(
+            name="weather-mcp", connection_type="http", url="http://localhost:7778/mcp"
+        )
+
+        clients = await asyncio.gather(
+            *(manager.get_client(server_def) for _ in range(5))
+        )
+        clients.append(await manager.get_client(server_def))
+
+        assert len(created) == 1
+        assert all(client is clients[0] for client in clients)
@@ -49,23 +49,19 @@ class TestMCPTools:
         
         # Check forecast tool arguments
         forecast_args = forecast_tool.get_argument_list()
-        assert "latitude" in forecast_args
-        assert "longitude" in forecast_args
-        assert "days" in forecast_args
+        assert {"latitude", "longitude", "days"} <= set(forecast_args)
         
         # Check historical tool arguments
         historical_args = historical_tool.get_argument_list()
-        assert "latitude" in historical_args
-        assert "longitude" in historical_args
-        assert "start_date" in historical_args
-        assert "end_date" in historical_args
+        assert {"latitude", "longitude", "start_date", "end_date"} <= set(
+            historical_args
+        )
         
         # Check agricultural tool arguments
         agricultural_args = agricultural_tool.get_argument_list()
-        assert "latitude" in agricultural_args
-        assert "longitude" in agricultural_args
-        assert "days" in agricultural_args
-        assert "crop_type" in agricultural_args
+        assert {"latitude", "longitude", "days", "crop_type"} <= set(
+            agricultural_args
+        )
     
     def test_mcp_tool_execute_raises_error_when_not_mocked(self):
         """Test that MCP tools raise RuntimeError when execute is called directly without mocking."""
@@ -0,0 +1,69 @@
+"""Tests for the order lookup tools."""
+from tools.ecommerce import _order_store
+from tools.ecommerce.get_order import GetOrderTool
+from tools.ecommerce.list_orders import ListOrdersTool
+
+
+class TestOrderTools:
+    """Tests for GetOrderTool and ListOrdersTool."""
+
+    def test_get_order_returns_matching_order(self):
+        """Test an existing order is returned by ID."""
+        result = GetOrderTool().execute(order_id="100")
+
+        assert result["id"] == "100"
+        assert result["email"] == "matt.murdock@nelsonmurdock.com"
+
+    def test_get_order_unknown_id(self):
+        """Test an unknown order ID returns an error."""
+        result = GetOrderTool().execute(order_id="does-not-exist")
+
+        assert result == {"error": "Order does-not-exist not found."}
+
+    def test_get_order_result_does_not_leak_into_cache(self):
+        """Test mutating a returned order doesn't affect later lookups."""
+        tool = GetOrderTool()
+        tool.execute(order_id="100")["status"] = "mutated"
+
+        assert tool.execute(order_id="100")["status"] != "mutated"
+
+    def test_list_orders_sorted_by_date(self):
+        """Test a customer's orders are returned sorted by order date."""
+        result = ListOrdersTool().execute(
+            email_address="matt.murdock@nelsonmurdock.com"
+        )
+
+        dates = [order["order_date"] for order in result["orders"]]
+        assert len(dates) == 3
+        assert dates == sorted(dates)
+
+    def test_list_orders_unknown_customer(self):
+        """Test an unknown email returns an error."""
+        result = ListOrdersTool().execute(email_address="nobody@example.com")
+
+        assert result == {"error": "No orders for customer nobody@example.com found."}
+
+    def test_list_orders_placeholder_email_returns_mock(self):
+        """Test a placeholder email returns mock orders without reading data."""
+        tool = ListOrdersTool()
+        result = tool.execute(email_address="{{user_email}}")
+
+        assert result["orders"][0]["order_id"] == "ORD123"
+        assert "{{user_email}}" in result["note"]
+
+        # Mutating one result must not leak into the next call
+        result["orders"][0]["status"] = "mutated"
+        result["orders"][0]["items"][0]["quantity"] = 99
+        again = tool.execute(email_address="{{user_email}}")["orders"][0]
+        assert again["status"] == "delivered"
+        assert again["items"][0]["quantity"] == 1
+
+    def test_missing_data_file(self, monkeypatch, tmp_path):
+        """Test a missing data file is reported rather than cached."""
+        _order_store._read_orders.cache_clear()
+        monkeypatch.setattr(_order_store, "ORDER_DATA_PATH", tmp_path / "missing.json")
+
+        result = GetOrderTool().execute(order_id="100")
+
+        assert result == {"error": "Data file not found."}
+        assert _order_store._read_orders.cache_info().currsize == 0
@@ -0,0 +1,43 @@
+"""Tests for the product search tool."""
+from tools.ecommerce.search_products import SearchProductsTool
+
+
+class TestSearchProductsTool:
+    """Tests for SearchProductsTool keyword dispatch and filtering."""
+
+    def test_keyword_selects_catalog(self):
+        """Test a known keyword returns its catalog regardless of case."""
+        result = SearchProductsTool().execute(query="Gaming KEYBOARD")
+
+        assert [p["id"] for p in result["products"]] == ["KB123", "KB456", "KB789"]
+        assert result["best_match"]["id"] == "KB123"
+
+    def test_unknown_query_returns_generic_products(self):
+        """Test an unmatched query returns generic products named after it."""
+        result = SearchProductsTool().execute(query="headphones")
+
+        assert result["count"] == 2
+        assert result["products"][1]["name"] == "Premium headphones"
+
+    def test_price_filter_does_not_change_catalog(self):
+        """Test filtering by price leaves later searches unaffected."""
+        tool = SearchProductsTool()
+        filtered = tool.execute(query="laptop", max_price=700)
+        unfiltered = tool.execute(query="laptop")
+
+        assert [p["id"] for p in filtered["products"]] == ["LP002"]
+        assert unfiltered["count"] == 2
+
+    def test_result_does_not_leak_into_catalog(self):
+        """Test mutating a returned product doesn't affect later searches."""
+        tool = SearchProductsTool()
+        tool.execute(query="laptop")["products"][0]["price"] = 0
+
+        assert tool.execute(query="laptop")["products"][0]["price"] == 899.99
+
+    def test_string_max_price_is_coerced(self):
+        """Test unvalidated string prices filter like validated floats."""
+        tool = SearchProductsTool()
+
+        assert tool.execute(query="laptop", max_price="700")["count"] == 1
+        assert tool.execute(query="laptop", max_price="none")["count"] == 2
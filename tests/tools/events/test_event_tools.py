@@ -0,0 +1,88 @@
+"""Tests for the event tools."""
+import zlib
+
+from tools.events._locations import normalize_location
+from tools.events.cancel_event import CancelEventTool
+from tools.events.create_event import CreateEventTool
+from tools.events.find_events import FindEventsTool
+
+
+class TestNormalizeLocation:
+    """Tests for shared location normalization."""
+
+    def test_aliases_map_to_city(self):
+        """Test common abbreviations resolve to the canonical city."""
+        assert normalize_location("Syd") == "Sydney"
+        assert normalize_location("welly") == "Wellington"
+        assert normalize_location("New Zealand") == "Wellington"
+
+    def test_unknown_location_is_title_cased(self):
+        """Test unknown locations fall back to title case."""
+        assert normalize_location("gold coast") == "Gold Coast"
+
+    def test_empty_location(self):
+        """Test an empty location normalizes to an empty string."""
+        assert normalize_location("") == ""
+
+
+class TestEventTools:
+    """Tests for creating and finding events."""
+
+    def test_create_event_normalizes_location(self):
+        """Test created events store the canonical city name."""
+        result = CreateEventTool().execute(
+            title="Team Meeting", date="2025-07-20 14:00", location="melb"
+        )
+
+        assert result["status"] == "created"
+        assert result["location"] == "Melbourne"
+        assert result["event_id"].startswith("EVT")
+
+    def test_find_events_by_alias(self):
+        """Test searching by an alias returns that city's events."""
+        result = FindEventsTool().execute(location="syd")
+
+        assert result["count"] > 0
+        assert all(event["location"] == "Sydney" for event in result["events"])
+
+    def test_find_events_by_month_name(self):
+        """Test month names and abbreviations filter to the same events."""
+        tool = FindEventsTool()
+        full = tool.execute(location="Auckland", date="March")
+        short = tool.execute(location="Auckland", date="mar")
+
+        assert full["events"] == short["events"]
+        for event in full["events"]:
+            assert "-03-" in event["date_from"] or "-03-" in event["date_to"]
+
+    def test_find_events_partial_location_match(self):
+        """Test a partial city name matches case-insensitively."""
+        result = FindEventsTool().execute(location="BOURNE")
+
+        assert result["count"] > 0
+        assert all(event["location"] == "Melbourne" for event in result["events"])
+
+    def test_find_events_result_does_not_leak_into_cache(self):
+        """Test mutating a returned event doesn't affect repeat searches."""
+        tool = FindEventsTool()
+        tool.execute(location="Sydney")["events"][0]["title"] = "mutated"
+
+        assert tool.execute(location="Sydney")["events"][0]["title"] != "mutated"
+
+    def test_find_events_ids_are_stable(self):
+        """Test event IDs are derived from a stable hash of the event name."""
+        result = FindEventsTool().execute(location="Perth")
+
+        ids = [event["id"] for event in result["events"]]
+        assert len(set(ids)) == len(ids)
+        event = result["events"][0]
+        crc = zlib.crc32(event["title"].encode()) % 10000
+        assert event["id"] == f"EVT_Perth_{crc:04d}"
+
+    def test_cancel_event_checks_id_prefix(self):
+        """Test only event, reservation and appointment IDs can be cancelled."""
+        tool = CancelEventTool()
+
+        assert tool.execute(event_id="RES5678")["status"] == "cancelled"
+        assert tool.execute(event_id="XYZ1") == {"error": "Event not found: XYZ1"}
+        assert tool.execute(event_id="") == {"error": "Event not found: "}
@@ -0,0 +1,49 @@
+"""Tests for the account lookup tools."""
+from tools.fin import _account_store
+from tools.fin.check_account_valid import check_account_valid
+from tools.fin.get_account_balances import get_account_balance
+
+
+class TestAccountTools:
+    """Tests for check_account_valid and get_account_balance."""
+
+    def test_check_account_valid_by_email_or_id(self):
+        """Test an account is found by either email or account ID."""
+        by_email = check_account_valid({"email": "matt.murdock@nelsonmurdock.com"})
+        by_id = check_account_valid({"account_id": "11235"})
+
+        assert by_email == by_id == {"status": "account valid"}
+
+    def test_check_account_valid_unknown_account(self):
+        """Test an unknown account returns an error."""
+        result = check_account_valid({"email": "nobody@example.com"})
+
+        assert "error" in result
+
+    def test_get_account_balance_by_email_or_id(self):
+        """Test balances are returned for either key."""
+        by_email = get_account_balance(
+            {"email_address_or_account_ID": "matt.murdock@nelsonmurdock.com"}
+        )
+        by_id = get_account_balance({"email_address_or_account_ID": "11235"})
+
+        assert by_email == by_id
+        assert by_email["name"] == "Matt Murdock"
+
+    def test_get_account_balance_unknown_account(self):
+        """Test an unknown key returns an error."""
+        result = get_account_balance({"email_address_or_account_ID": "00000"})
+
+        assert result == {"error": "Account not found with for 00000"}
+
+    def test_missing_data_file(self, monkeypatch, tmp_path):
+        """Test a missing data file is reported rather than cached."""
+        _account_store._read_accounts.cache_clear()
+        monkeypatch.setattr(
+            _account_store, "ACCOUNT_DATA_PATH", tmp_path / "missing.json"
+        )
+
+        result = check_account_valid({"account_id": "11235"})
+
+        assert result == {"error": "Data file not found."}
+        assert _account_store._read_accounts.cache_info().currsize == 0
@@ -0,0 +1,33 @@
+"""Tests for the current PTO tool."""
+from tools.hr import current_pto as current_pto_module
+from tools.hr.current_pto import current_pto
+
+
+class TestCurrentPto:
+    """Tests for current_pto lookups."""
+
+    def test_known_employee(self):
+        """Test an employee's PTO is reported in hours and days."""
+        result = current_pto({"email": "laine@awesome.com"})
+
+        assert result == {"num_hours": 40, "num_days": 5.0}
+
+    def test_unknown_employee(self):
+        """Test an unknown email returns an error."""
+        result = current_pto({"email": "nobody@example.com"})
+
+        assert result == {
+            "error": "Employee not found with email address nobody@example.com"
+        }
+
+    def test_missing_data_file(self, monkeypatch, tmp_path):
+        """Test a missing data file is reported rather than cached."""
+        current_pto_module._employees_by_email.cache_clear()
+        monkeypatch.setattr(
+            current_pto_module, "PTO_DATA_PATH", tmp_path / "missing.json"
+        )
+
+        result = current_pto({"email": "laine@awesome.com"})
+
+        assert result == {"error": "Data file not found."}
+        assert current_pto_module._employees_by_email.cache_info().currsize == 0
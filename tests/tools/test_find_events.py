@@ -0,0 +1,40 @@
+"""Tests for the function-style find_events tool."""
+from tools import find_events as find_events_module
+from tools.find_events import find_events
+
+
+class TestFindEvents:
+    """Tests for month-window event search."""
+
+    def test_events_tagged_with_month_context(self):
+        """Test events come from the requested month or one either side."""
+        result = find_events({"month": "march"})
+
+        contexts = {event["month"] for event in result["events"]}
+        assert result["events"]
+        assert contexts <= {"requested month", "previous month", "next month"}
+        assert "February, March, April" in result["note"]
+
+    def test_city_filter_is_case_insensitive(self):
+        """Test a partial, differently-cased city name filters results."""
+        result = find_events({"city": "SYD", "month": "March"})
+
+        assert {event["city"] for event in result["events"]} == {"Sydney"}
+
+    def test_invalid_month(self):
+        """Test an unknown month name is rejected."""
+        result = find_events({"month": "Smarch"})
+
+        assert "error" in result
+
+    def test_missing_data_file(self, monkeypatch, tmp_path):
+        """Test a missing data file is reported rather than cached."""
+        find_events_module._load_events.cache_clear()
+        monkeypatch.setattr(
+            find_events_module, "EVENTS_DATA_PATH", tmp_path / "missing.json"
+        )
+
+        result = find_events({"month": "March"})
+
+        assert result == {"error": "Data file not found."}
+        assert find_events_module._load_events.cache_info().currsize == 0
@@ -4,8 +4,6 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from temporalio import activity
-from temporalio.testing import WorkflowEnvironment
-from temporalio.worker import Worker
 
 from activities.extract_agent_activity import ExtractAgentActivity
 from activities.react_agent_activity import ReactAgentActivity
@@ -16,13 +14,11 @@ from models.types import (
     ReactAgentActivityResult,
     ToolExecutionResult,
     WorkflowSummary,
-    Message,
 )
 from models.trajectory import Trajectory
 from workflows.agentic_ai_workflow import AgenticAIWorkflow
 
 
-@pytest.mark.asyncio
 class TestAgenticAIWorkflow:
     """Tests for agentic AI workflow with consolidated tools."""
     
@@ -30,11 +26,15 @@ class TestAgenticAIWorkflow:
         """Test that workflow executes consolidated MCP tools through ToolExecutionActivity."""
         # Skip this test for now - workflow with signals is complex to test in time-skipping mode
         pytest.skip("Workflow signal testing needs refactoring for time-skipping environment")
+        # Imported lazily so collecting this module does not load the test server
+        from temporalio.testing import WorkflowEnvironment
+        from temporalio.worker import Worker
+
         async with await WorkflowEnvironment.start_time_skipping() as env:
-            # Track call counts for debugging
-            react_call_count = 0
-            tool_call_count = 0
-            extract_call_count = 0
+            # Record activity calls for debugging
+            react_calls = []
+            tool_calls = []
+            extract_calls = []
             
             # Mock activities
             trajectory = Trajectory(
@@ -72,9 +72,8 @@ class TestAgenticAIWorkflow:
             # Create mock activities
             @activity.defn(name="run_react_agent")
             async def mock_react_agent(*args):
-                nonlocal react_call_count
-                react_call_count += 1
-                if react_call_count == 1:
+                react_calls.append(args)
+                if len(react_calls) == 1:
                     # First call - return trajectory with tool to execute
                     return mock_react_result
                 else:
@@ -93,14 +92,12 @@ class TestAgenticAIWorkflow:
             
             @activity.defn(name="execute_tool")
             async def mock_execute_tool(*args):
-                nonlocal tool_call_count
-                tool_call_count += 1
+                tool_calls.append(args)
                 return mock_tool_result
             
             @activity.defn(name="run_extract_agent")
             async def mock_extract_agent(*args):
-                nonlocal extract_call_count
-                extract_call_count += 1
+                extract_calls.append(args)
                 return mock_extract_result
             
             # Run workflow with mocked activities
@@ -143,7 +140,7 @@ class TestAgenticAIWorkflow:
                 print(f"Result type: {type(result)}")
                 print(f"Result length: {len(result)}")
                 print(f"Messages: {[msg.role for msg in result]}")
-                print(f"Call counts - React: {react_call_count}, Tool: {tool_call_count}, Extract: {extract_call_count}")
+                print(f"Call counts - React: {len(react_calls)}, Tool: {len(tool_calls)}, Extract: {len(extract_calls)}")
                 
                 assert len(result) > 0, f"Expected messages but got: {result}"
                 # Find assistant/agent response (workflow uses 'agent' role)
@@ -155,6 +152,10 @@ class TestAgenticAIWorkflow:
         """Test workflow with multiple tool iterations."""
         # Skip this test for now - workflow with signals is complex to test in time-skipping mode
         pytest.skip("Workflow signal testing needs refactoring for time-skipping environment")
+        # Imported lazily so collecting this module does not load the test server
+        from temporalio.testing import WorkflowEnvironment
+        from temporalio.worker import Worker
+
         async with await WorkflowEnvironment.start_time_skipping() as env:
             # Mock first React iteration
             trajectory_1 = Trajectory(
@@ -215,16 +216,15 @@ class TestAgenticAIWorkflow:
             )
             
             # Track calls
-            react_call_count = 0
-            tool_call_count = 0
+            react_calls = []
+            tool_calls = []
             
             @activity.defn(name="run_react_agent")
             async def mock_react_agent(*args):
-                nonlocal react_call_count
-                react_call_count += 1
-                if react_call_count == 1:
+                react_calls.append(args)
+                if len(react_calls) == 1:
                     return mock_react_result_1
-                elif react_call_count == 2:
+                elif len(react_calls) == 2:
                     return mock_react_result_2
                 else:
                     # Final call - no more tools needed
@@ -243,9 +243,8 @@ class TestAgenticAIWorkflow:
             
             @activity.defn(name="execute_tool")
             async def mock_execute_tool(*args):
-                nonlocal tool_call_count
-                tool_call_count += 1
-                if tool_call_count == 1:
+                tool_calls.append(args)
+                if len(tool_calls) == 1:
                     return mock_tool_result_1
                 else:
                     return mock_tool_result_2
@@ -291,7 +290,7 @@ class TestAgenticAIWorkflow:
                 final_response = agent_messages[-1].content
                 assert "20°C" in final_response
                 assert "15°C" in final_response
-                # The workflow reaches max iterations (5) so we expect 3 react calls
-                # (initial forecast, historical weather, then completion signal)
-                assert react_call_count == 3
-                assert tool_call_count == 2  # Only 2 actual tool executions
\ No newline at end of file
+                # The mock finishes on the third react call, well before the workflow's
+                # iteration limit: forecast, historical weather, then completion signal
+                assert len(react_calls) == 3
+                assert len(tool_calls) == 2  # Only 2 actual tool executions
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""Shared helpers for the mock mode of the agriculture weather tools."""
+from functools import lru_cache
+
+# Mock geocoding table for common locations
+MOCK_COORDS = {
+    "new york": (40.7128, -74.0060),
+    "chicago": (41.8781, -87.6298),
+    "los angeles": (34.0522, -118.2437),
+    "sydney": (-33.8688, 151.2093),
+    "melbourne": (-37.8136, 144.9631),
+}
+
+
+def mock_geocode(location: str) -> tuple[float, float]:
+    """Mock geocoding for common locations."""
+    return _mock_geocode_lower(location.lower())
+
+
+@lru_cache(maxsize=1024)
+def _mock_geocode_lower(location_lower: str) -> tuple[float, float]:
+    """Resolve a lower-cased location.
+
+    Cached because agents tend to ask about the same few locations repeatedly,
+    and keyed on the lower-cased name so "Chicago" and "chicago" share an entry.
+    """
+    # Fast path: exact match on the city part of "City, State"
+    coords = MOCK_COORDS.get(location_lower.split(",")[0].strip())
+    if coords:
+        return coords
+    for key, coords in MOCK_COORDS.items():
+        if key in location_lower:
+            return coords
+    # Default to NYC if not found
+    return MOCK_COORDS["new york"]
@@ -1,18 +1,36 @@
-import os
-from datetime import datetime, timedelta
 from typing import ClassVar, Optional, Type
 
-import requests
 from pydantic import BaseModel
 
-from models.types import MCPConfig
-from models.tool_definitions import MCPServerDefinition
 from shared.tool_utils.mcp_tool import MCPTool
+from tools.agriculture._mock_common import mock_geocode
 
 # Import the shared Pydantic model
 from models.mcp_models import AgriculturalRequest
 
 
+# Static text of the mock response, filled in per call by _mock_results
+_MOCK_RESULTS_TEMPLATE = """Agricultural Conditions for {coords}
+Location: {location_name}
+Forecast Period: {days} days
+
+Current Soil Conditions:
+- Surface (0-1cm): 25.5% moisture
+- Shallow (1-3cm): 28.2% moisture
+- Root Zone (3-9cm): 32.1% moisture
+- Deep (9-27cm): 35.8% moisture
+
+Growing Conditions:
+- Evapotranspiration: 3.2mm/day
+- Soil Temperature (10cm): 18.5°C
+- Growing Degree Days: 12.5
+
+Forecast Summary:
+- Next 3 days: Favorable conditions for planting
+- Precipitation expected: Day 4-5
+- Frost risk: Low"""
+
+
 class AgriculturalWeatherTool(MCPTool):
     NAME: ClassVar[str] = "get_agricultural_conditions"
     MODULE: ClassVar[str] = "tools.agriculture.agricultural_weather"
@@ -51,19 +69,7 @@ class AgriculturalWeatherTool(MCPTool):
     
     def _mock_geocode(self, location: str) -> tuple[float, float]:
         """Mock geocoding for common locations."""
-        mock_coords = {
-            "new york": (40.7128, -74.0060),
-            "chicago": (41.8781, -87.6298),
-            "los angeles": (34.0522, -118.2437),
-            "sydney": (-33.8688, 151.2093),
-            "melbourne": (-37.8136, 144.9631),
-        }
-        location_lower = location.lower()
-        for key, coords in mock_coords.items():
-            if key in location_lower:
-                return coords
-        # Default to NYC if not found
-        return (40.7128, -74.0060)
+        return mock_geocode(location)
 
     def _mock_results(
         self,
@@ -73,29 +79,14 @@ class AgriculturalWeatherTool(MCPTool):
         crop_type: Optional[str] = None,
     ) -> str:
         """Return simple mock agricultural weather data."""
-        location_name = f"Agricultural location at {latitude:.4f}, {longitude:.4f}"
+        coords = f"{latitude:.4f}, {longitude:.4f}"
+        location_name = f"Agricultural location at {coords}"
         if crop_type:
             location_name += f" ({crop_type} farming)"
             
-        return f"""Agricultural Conditions for {latitude:.4f}, {longitude:.4f}
-Location: {location_name}
-Forecast Period: {days} days
-
-Current Soil Conditions:
-- Surface (0-1cm): 25.5% moisture
-- Shallow (1-3cm): 28.2% moisture
-- Root Zone (3-9cm): 32.1% moisture
-- Deep (9-27cm): 35.8% moisture
-
-Growing Conditions:
-- Evapotranspiration: 3.2mm/day
-- Soil Temperature (10cm): 18.5°C
-- Growing Degree Days: 12.5
-
-Forecast Summary:
-- Next 3 days: Favorable conditions for planting
-- Precipitation expected: Day 4-5
-- Frost risk: Low"""
+        return _MOCK_RESULTS_TEMPLATE.format(
+            coords=coords, location_name=location_name, days=days
+        )
 
     def get_test_cases(self) -> list[dict]:
         return [
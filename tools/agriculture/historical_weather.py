@@ -1,18 +1,30 @@
-import os
-from datetime import datetime, timedelta
 from typing import ClassVar, Optional, Type
 
-import requests
 from pydantic import BaseModel
 
-from models.types import MCPConfig
-from models.tool_definitions import MCPServerDefinition
 from shared.tool_utils.mcp_tool import MCPTool
+from tools.agriculture._mock_common import mock_geocode
 
 # Import the shared Pydantic model
 from models.mcp_models import HistoricalRequest
 
 
+# Static text of the mock response, filled in per call by _mock_results
+_MOCK_RESULTS_TEMPLATE = """Historical Weather Data for {coords}
+Location: Location at {coords}
+Period: {start_date} to {end_date}
+
+Daily Summary:
+- 2025-01-01: High 15°C, Low 8°C, Precipitation 0mm
+- 2025-01-02: High 17°C, Low 10°C, Precipitation 2.1mm
+- 2025-01-03: High 14°C, Low 7°C, Precipitation 0mm
+
+Averages for Period:
+- Temperature: 12.5°C
+- Precipitation: 0.7mm/day
+- Humidity: 60%"""
+
+
 class HistoricalWeatherTool(MCPTool):
     NAME: ClassVar[str] = "get_historical_weather"
     MODULE: ClassVar[str] = "tools.agriculture.historical_weather"
@@ -51,19 +63,7 @@ class HistoricalWeatherTool(MCPTool):
     
     def _mock_geocode(self, location: str) -> tuple[float, float]:
         """Mock geocoding for common locations."""
-        mock_coords = {
-            "new york": (40.7128, -74.0060),
-            "chicago": (41.8781, -87.6298),
-            "los angeles": (34.0522, -118.2437),
-            "sydney": (-33.8688, 151.2093),
-            "melbourne": (-37.8136, 144.9631),
-        }
-        location_lower = location.lower()
-        for key, coords in mock_coords.items():
-            if key in location_lower:
-                return coords
-        # Default to NYC if not found
-        return (40.7128, -74.0060)
+        return mock_geocode(location)
 
     def _mock_results(
         self,
@@ -73,19 +73,10 @@ class HistoricalWeatherTool(MCPTool):
         end_date: str,
     ) -> str:
         """Return simple mock historical weather data."""
-        return f"""Historical Weather Data for {latitude:.4f}, {longitude:.4f}
-Location: Location at {latitude:.4f}, {longitude:.4f}
-Period: {start_date} to {end_date}
-
-Daily Summary:
-- 2025-01-01: High 15°C, Low 8°C, Precipitation 0mm
-- 2025-01-02: High 17°C, Low 10°C, Precipitation 2.1mm
-- 2025-01-03: High 14°C, Low 7°C, Precipitation 0mm
-
-Averages for Period:
-- Temperature: 12.5°C
-- Precipitation: 0.7mm/day
-- Humidity: 60%"""
+        coords = f"{latitude:.4f}, {longitude:.4f}"
+        return _MOCK_RESULTS_TEMPLATE.format(
+            coords=coords, start_date=start_date, end_date=end_date
+        )
 
     def get_test_cases(self) -> list[dict]:
         return [
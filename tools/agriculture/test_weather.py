@@ -5,11 +5,12 @@ Tests mock responses by default, use --real to test actual API integration.
 Outputs only JSON responses.
 """
 
-import json
 import os
 import sys
 from datetime import datetime, timedelta
 
+import orjson
+
 # Add project root to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../"))
 
@@ -117,7 +118,7 @@ def test_all_weather_tools(use_real=False):
         "results": results,
     }
 
-    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    print(orjson.dumps(summary, option=orjson.OPT_INDENT_2).decode())
 
     return all(r["success"] for r in results)
 
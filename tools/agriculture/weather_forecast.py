@@ -1,18 +1,31 @@
-import os
-from datetime import datetime, timedelta
 from typing import ClassVar, Optional, Type
 
-import requests
 from pydantic import BaseModel
 
-from models.types import MCPConfig
-from models.tool_definitions import MCPServerDefinition
 from shared.tool_utils.mcp_tool import MCPTool
+from tools.agriculture._mock_common import mock_geocode
 
 # Import the shared Pydantic model
 from models.mcp_models import ForecastRequest
 
 
+# Static text of the mock response, filled in per call by _mock_results
+_MOCK_RESULTS_TEMPLATE = """Weather Forecast for {coords}
+Location: Location at {coords}
+Forecast Period: {days} days
+
+Current Conditions:
+- Temperature: 20°C
+- Humidity: 65%
+- Wind Speed: 10 km/h
+- Precipitation: 0 mm
+
+Daily Forecast Summary:
+- 2025-01-15: High 23°C, Low 16°C, Precipitation 0mm
+- 2025-01-16: High 24°C, Low 17°C, Precipitation 1.2mm
+- 2025-01-17: High 22°C, Low 15°C, Precipitation 0.5mm"""
+
+
 class WeatherForecastTool(MCPTool):
     NAME: ClassVar[str] = "get_weather_forecast"
     MODULE: ClassVar[str] = "tools.agriculture.weather_forecast"
@@ -45,36 +58,12 @@ class WeatherForecastTool(MCPTool):
     
     def _mock_geocode(self, location: str) -> tuple[float, float]:
         """Mock geocoding for common locations."""
-        mock_coords = {
-            "new york": (40.7128, -74.0060),
-            "chicago": (41.8781, -87.6298),
-            "los angeles": (34.0522, -118.2437),
-            "sydney": (-33.8688, 151.2093),
-            "melbourne": (-37.8136, 144.9631),
-        }
-        location_lower = location.lower()
-        for key, coords in mock_coords.items():
-            if key in location_lower:
-                return coords
-        # Default to NYC if not found
-        return (40.7128, -74.0060)
+        return mock_geocode(location)
 
     def _mock_results(self, latitude: float, longitude: float, days: int = 7) -> str:
         """Return simple mock weather forecast data."""
-        return f"""Weather Forecast for {latitude:.4f}, {longitude:.4f}
-Location: Location at {latitude:.4f}, {longitude:.4f}
-Forecast Period: {days} days
-
-Current Conditions:
-- Temperature: 20°C
-- Humidity: 65%
-- Wind Speed: 10 km/h
-- Precipitation: 0 mm
-
-Daily Forecast Summary:
-- 2025-01-15: High 23°C, Low 16°C, Precipitation 0mm
-- 2025-01-16: High 24°C, Low 17°C, Precipitation 1.2mm
-- 2025-01-17: High 22°C, Low 15°C, Precipitation 0.5mm"""
+        coords = f"{latitude:.4f}, {longitude:.4f}"
+        return _MOCK_RESULTS_TEMPLATE.format(coords=coords, days=days)
 
     def get_test_cases(self) -> list[dict]:
         return [
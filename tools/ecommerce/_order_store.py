@@ -0,0 +1,46 @@
+"""Cached, indexed access to the customer order data file."""
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+import orjson
+
+ORDER_DATA_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "customer_order_data.json"
+)
+
+
+class OrderIndex(NamedTuple):
+    """Orders indexed for constant-time lookup."""
+
+    by_id: Dict[str, Dict[str, Any]]
+    # Each customer's orders, already sorted by order date
+    by_email: Dict[str, List[Dict[str, Any]]]
+
+
+@lru_cache(maxsize=1)
+def _read_orders() -> OrderIndex:
+    """Read and index the order data file once per process.
+
+    Errors such as a missing file propagate and are not cached.
+    """
+    order_list = orjson.loads(ORDER_DATA_PATH.read_bytes())["orders"]
+
+    by_id: Dict[str, Dict[str, Any]] = {}
+    by_email: Dict[str, List[Dict[str, Any]]] = {}
+    for order in order_list:
+        # Keep the first order for a duplicated ID, as the old linear scan did
+        by_id.setdefault(order["id"], order)
+        by_email.setdefault(order["email"], []).append(order)
+    for orders in by_email.values():
+        orders.sort(key=lambda x: x["order_date"])
+
+    return OrderIndex(by_id=by_id, by_email=by_email)
+
+
+def load_orders() -> Optional[OrderIndex]:
+    """Return the order index, or None if the data file does not exist."""
+    try:
+        return _read_orders()
+    except FileNotFoundError:
+        return None
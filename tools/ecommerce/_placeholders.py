@@ -0,0 +1,7 @@
+"""Helpers for the ``{{placeholder}}`` values the agent passes in demo mode."""
+
+
+def is_placeholder(value: str) -> bool:
+    """Return True for template placeholders such as ``{{user_email}}``."""
+    # Slicing avoids two method calls on every tool dispatch
+    return value[:2] == "{{" and value[-2:] == "}}"
@@ -4,6 +4,14 @@ from typing import Any, ClassVar, Dict, List, Type
 from pydantic import BaseModel, Field, field_validator
 
 from shared.tool_utils.base_tool import BaseTool, ToolTestCase
+from tools.ecommerce._placeholders import is_placeholder
+
+# Response returned when the agent passes a placeholder product ID
+_MOCK_CART_RESULT = {
+    "cart_total": 2,
+    "added": "LAPTOP123",  # Mock product ID
+    "status": "success",
+}
 
 
 class AddToCartTool(BaseTool):
@@ -38,12 +46,9 @@ class AddToCartTool(BaseTool):
     ) -> dict:
         """Execute the tool to add product to cart."""
         # Handle placeholder values for demo purposes
-        if product_id.startswith("{{") and product_id.endswith("}}"):
-            return {
-                "cart_total": 2,
-                "added": "LAPTOP123",  # Mock product ID
+        if is_placeholder(product_id):
+            return _MOCK_CART_RESULT | {
                 "quantity": quantity,
-                "status": "success",
                 "note": f"Mock execution with placeholder: {product_id}",
             }
 
@@ -1,11 +1,10 @@
 """Get order tool implementation using the unified base class."""
-import json
-from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Type
 
 from pydantic import BaseModel, Field
 
 from shared.tool_utils.base_tool import BaseTool, ToolTestCase
+from tools.ecommerce._order_store import load_orders
 
 
 class GetOrderTool(BaseTool):
@@ -25,19 +24,14 @@ class GetOrderTool(BaseTool):
 
     def execute(self, order_id: str) -> Dict[str, Any]:
         """Execute the tool to get order details."""
-        file_path = (
-            Path(__file__).resolve().parent.parent / "data" / "customer_order_data.json"
-        )
-        if not file_path.exists():
+        orders = load_orders()
+        if orders is None:
             return {"error": "Data file not found."}
 
-        with open(file_path, "r") as file:
-            data = json.load(file)
-        order_list = data["orders"]
-
-        for order in order_list:
-            if order["id"] == order_id:
-                return order
+        order = orders.by_id.get(order_id)
+        if order is not None:
+            # Copy so callers can't mutate the cached index
+            return dict(order)
 
         return {"error": f"Order {order_id} not found."}
 
@@ -1,11 +1,20 @@
 """List orders tool implementation using the unified base class."""
-import json
-from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Type
 
 from pydantic import BaseModel, Field, field_validator
 
 from shared.tool_utils.base_tool import BaseTool, ToolTestCase
+from tools.ecommerce._order_store import load_orders
+from tools.ecommerce._placeholders import is_placeholder
+
+# Order returned when the agent passes a placeholder email address
+_MOCK_ORDER = {
+    "order_id": "ORD123",
+    "order_date": "2024-01-15",
+    "status": "delivered",
+    "total": "$99.99",
+    "items": [{"item_id": "SKU789", "name": "Product Name", "quantity": 1}],
+}
 
 
 class ListOrdersTool(BaseTool):
@@ -35,7 +44,7 @@ class ListOrdersTool(BaseTool):
             v = str(v)
 
             # Allow placeholder values for testing/demo purposes
-            if v.startswith("{{") and v.endswith("}}"):
+            if is_placeholder(v):
                 return v.strip()
 
             # Regular email validation
@@ -50,40 +59,25 @@ class ListOrdersTool(BaseTool):
     def execute(self, email_address: str = "{{user_email}}") -> Dict[str, Any]:
         """Execute the tool to list customer orders."""
         # Handle placeholder values for testing/demo
-        if email_address.startswith("{{") and email_address.endswith("}}"):
+        if is_placeholder(email_address):
+            # Copy, including the items, so callers can't mutate the shared mock
+            mock_order = {
+                **_MOCK_ORDER,
+                "items": [dict(i) for i in _MOCK_ORDER["items"]],
+            }
             return {
-                "orders": [
-                    {
-                        "order_id": "ORD123",
-                        "order_date": "2024-01-15",
-                        "status": "delivered",
-                        "total": "$99.99",
-                        "items": [
-                            {"item_id": "SKU789", "name": "Product Name", "quantity": 1}
-                        ],
-                    }
-                ],
+                "orders": [mock_order],
                 "note": f"Mock data returned for placeholder email: {email_address}",
             }
 
-        file_path = (
-            Path(__file__).resolve().parent.parent / "data" / "customer_order_data.json"
-        )
-        if not file_path.exists():
+        orders = load_orders()
+        if orders is None:
             return {"error": "Data file not found."}
 
-        with open(file_path, "r") as file:
-            data = json.load(file)
-        order_list = data["orders"]
-
-        customer_orders = []
-        for order in order_list:
-            if order["email"] == email_address:
-                customer_orders.append(order)
+        # Already sorted by order date; copy so callers can't mutate the index
+        customer_orders = [dict(o) for o in orders.by_email.get(email_address, ())]
 
         if customer_orders:
-            # Sort by order date
-            customer_orders.sort(key=lambda x: x["order_date"])
             return {"orders": customer_orders}
         else:
             return {"error": f"No orders for customer {email_address} found."}
@@ -1,10 +1,85 @@
 """Search products tool implementation using the unified base class."""
-from typing import Any, ClassVar, Dict, List, Optional, Type, Union
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, Union
 
 from pydantic import BaseModel, Field, field_validator
 
 from shared.tool_utils.base_tool import BaseTool, ToolTestCase
 
+_KEYBOARD_PRODUCTS = (
+    {
+        "id": "KB123",
+        "name": "Gaming Mechanical Keyboard RGB",
+        "price": 129.99,
+        "rating": 4.5,
+    },
+    {
+        "id": "KB456",
+        "name": "Wireless Gaming Keyboard",
+        "price": 89.99,
+        "rating": 4.2,
+    },
+    {
+        "id": "KB789",
+        "name": "Pro Gaming Keyboard",
+        "price": 149.99,
+        "rating": 4.8,
+    },
+)
+
+_LAPTOP_PRODUCTS = (
+    {
+        "id": "LP001",
+        "name": "Gaming Laptop 15-inch",
+        "price": 899.99,
+        "rating": 4.3,
+    },
+    {
+        "id": "LP002",
+        "name": "Business Laptop",
+        "price": 649.99,
+        "rating": 4.1,
+    },
+)
+
+# Checked in order; the first keyword found in the query picks the catalog
+_KEYWORD_CATALOG = (
+    ("keyboard", _KEYBOARD_PRODUCTS),
+    ("laptop", _LAPTOP_PRODUCTS),
+)
+
+
+@lru_cache(maxsize=256)
+def _find_products(query: str, max_price: Optional[float]) -> Tuple[dict, ...]:
+    """Return products matching a query, cached since results are static."""
+    # Generate realistic product results based on query
+    query_lower = query.lower()
+
+    for keyword, catalog in _KEYWORD_CATALOG:
+        if keyword in query_lower:
+            products = catalog
+            break
+    else:  # no keyword matched
+        # Generic products for other searches
+        products = (
+            {
+                "id": "PROD001",
+                "name": f"Product matching '{query}'",
+                "price": 99.99,
+                "rating": 4.0,
+            },
+            {
+                "id": "PROD002",
+                "name": f"Premium {query}",
+                "price": 199.99,
+                "rating": 4.5,
+            },
+        )
+
+    if max_price is not None:
+        products = tuple(p for p in products if p["price"] <= max_price)
+    return products
+
 
 class SearchProductsTool(BaseTool):
     """Tool for searching products in the catalog."""
@@ -43,69 +118,14 @@ class SearchProductsTool(BaseTool):
         max_price: Union[float, str, None] = None,
     ) -> dict:
         """Execute the tool to search products."""
-        # Generate realistic product results based on query
-        products = []
-
-        if "gaming keyboard" in query.lower() or "keyboard" in query.lower():
-            products = [
-                {
-                    "id": "KB123",
-                    "name": "Gaming Mechanical Keyboard RGB",
-                    "price": 129.99,
-                    "rating": 4.5,
-                },
-                {
-                    "id": "KB456",
-                    "name": "Wireless Gaming Keyboard",
-                    "price": 89.99,
-                    "rating": 4.2,
-                },
-                {
-                    "id": "KB789",
-                    "name": "Pro Gaming Keyboard",
-                    "price": 149.99,
-                    "rating": 4.8,
-                },
-            ]
-        elif "laptop" in query.lower():
-            products = [
-                {
-                    "id": "LP001",
-                    "name": "Gaming Laptop 15-inch",
-                    "price": 899.99,
-                    "rating": 4.3,
-                },
-                {
-                    "id": "LP002",
-                    "name": "Business Laptop",
-                    "price": 649.99,
-                    "rating": 4.1,
-                },
-            ]
-        else:
-            # Generic products for other searches
-            products = [
-                {
-                    "id": "PROD001",
-                    "name": f"Product matching '{query}'",
-                    "price": 99.99,
-                    "rating": 4.0,
-                },
-                {
-                    "id": "PROD002",
-                    "name": f"Premium {query}",
-                    "price": 199.99,
-                    "rating": 4.5,
-                },
-            ]
-
-        # Apply price filter
-        if max_price is not None:
-            try:
-                max_price_float = float(max_price)
-                products = [p for p in products if p["price"] <= max_price_float]
-            except (ValueError, TypeError):
-                pass  # Skip price filtering if conversion fails
+        # Validated arguments are already Optional[float]; direct callers may
+        # still pass strings, so coerce those with the model's validator
+        price_limit = max_price
+        if price_limit is not None and not isinstance(price_limit, float):
+            price_limit = self.Arguments.validate_max_price(price_limit)
+
+        # Copy so callers can't mutate the cached catalog entries
+        products = [dict(p) for p in _find_products(query, price_limit)]
 
         return {
             "products": products,
@@ -0,0 +1,28 @@
+"""Location normalization shared by the event tools."""
+
+# Map common variations to standard city names
+LOCATION_MAP = {
+    "syd": "Sydney",
+    "sydney": "Sydney",
+    "auckland": "Auckland",
+    "auck": "Auckland",
+    "melbourne": "Melbourne",
+    "mel": "Melbourne",
+    "melb": "Melbourne",
+    "brisbane": "Brisbane",
+    "bris": "Brisbane",
+    "perth": "Perth",
+    "adelaide": "Adelaide",
+    "adel": "Adelaide",
+    "wellington": "Wellington",
+    "welly": "Wellington",
+    "wellington nz": "Wellington",
+    "new zealand": "Wellington",
+}
+
+
+def normalize_location(location: str) -> str:
+    """Normalize a location name to the city key used in the events data"""
+    if not location:
+        return ""
+    return LOCATION_MAP.get(location.lower()) or location.title()
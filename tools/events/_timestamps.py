@@ -0,0 +1,7 @@
+"""Timestamp formatting shared by the event tools."""
+from datetime import datetime
+
+
+def now_iso() -> str:
+    """Return the current local time as an ISO 8601 string, to the second."""
+    return datetime.now().isoformat(timespec="seconds")
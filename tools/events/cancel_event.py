@@ -1,9 +1,12 @@
-from datetime import datetime
-from typing import ClassVar, Optional, Type
+from typing import ClassVar, Optional, Tuple, Type
 
 from pydantic import BaseModel, Field
 
 from shared.tool_utils.base_tool import BaseTool
+from tools.events._timestamps import now_iso
+
+# ID prefixes for events, reservations and appointments
+_VALID_PREFIXES: Tuple[str, ...] = ("EVT", "RES", "APT")
 
 
 class EventCancellationRequest(BaseModel):
@@ -33,18 +36,14 @@ class CancelEventTool(BaseTool):
     ) -> dict:
         try:
             # Mock event lookup
-            event_exists = event_id.startswith(("EVT", "RES", "APT"))
-
-            if not event_exists:
+            if not event_id or not event_id.startswith(_VALID_PREFIXES):
                 return {"error": f"Event not found: {event_id}"}
 
-            current_time = datetime.now()
-
             return {
                 "status": "cancelled",
                 "event_id": event_id,
                 "reason": reason or "No reason provided",
-                "cancelled_at": current_time.isoformat(),
+                "cancelled_at": now_iso(),
                 "attendees_notified": notify_attendees,
                 "confirmation": f"Event {event_id} has been successfully cancelled",
                 "refund_status": "Processing refund if applicable",
@@ -1,13 +1,14 @@
-import json
-import os
 import random
-from datetime import datetime
-from pathlib import Path
 from typing import ClassVar, Type
 
 from pydantic import BaseModel, Field
 
 from shared.tool_utils.base_tool import BaseTool
+from tools.events._locations import normalize_location
+from tools.events._timestamps import now_iso
+
+# Dedicated generator for mock event IDs
+_RNG = random.Random()
 
 
 class EventCreationRequest(BaseModel):
@@ -32,43 +33,15 @@ class CreateEventTool(BaseTool):
     )
     args_model: Type[BaseModel] = EventCreationRequest
 
-    def _normalize_location(self, location: str) -> str:
-        """Normalize location name for storage"""
-        location_lower = location.lower()
-
-        # Map common variations to standard city names
-        location_mapping = {
-            "syd": "Sydney",
-            "sydney": "Sydney",
-            "auckland": "Auckland",
-            "auck": "Auckland",
-            "melbourne": "Melbourne",
-            "mel": "Melbourne",
-            "melb": "Melbourne",
-            "brisbane": "Brisbane",
-            "bris": "Brisbane",
-            "perth": "Perth",
-            "adelaide": "Adelaide",
-            "adel": "Adelaide",
-            "wellington": "Wellington",
-            "welly": "Wellington",
-            "wellington nz": "Wellington",
-        }
-
-        return location_mapping.get(location_lower, location.title())
-
     def execute(
         self, title: str, date: str, location: str, description: str = ""
     ) -> dict:
         try:
             # Generate a unique event ID
-            event_id = f"EVT{random.randint(1000, 9999)}"
+            event_id = f"EVT{1000 + _RNG.getrandbits(14) % 9000}"
 
             # Normalize the location
-            normalized_location = self._normalize_location(location)
-
-            # Parse and validate the date (simplified)
-            current_time = datetime.now()
+            normalized_location = normalize_location(location)
 
             # For demonstration purposes, we'll just return success
             # In a real implementation, you'd save this to the JSON file
@@ -79,7 +52,7 @@ class CreateEventTool(BaseTool):
                 "date": date,
                 "location": normalized_location,
                 "description": description or "No description provided",
-                "created_at": current_time.isoformat(),
+                "created_at": now_iso(),
                 "confirmation": f"Successfully created event '{title}' for {date} in {normalized_location}",
                 "note": "Event would be stored in the location-based structure for future searches",
             }
@@ -1,12 +1,166 @@
-import json
-import os
+import zlib
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import ClassVar, Optional, Type
+from typing import Callable, ClassVar, Optional, Type
 
+import orjson
 from pydantic import BaseModel, Field
 
 from shared.tool_utils.base_tool import BaseTool
+from tools.events._locations import normalize_location
+
+# Month names and abbreviations accepted as a date filter
+_MONTH_ALIASES = {
+    "january": 1,
+    "jan": 1,
+    "february": 2,
+    "feb": 2,
+    "march": 3,
+    "mar": 3,
+    "april": 4,
+    "apr": 4,
+    "may": 5,
+    "june": 6,
+    "jun": 6,
+    "july": 7,
+    "jul": 7,
+    "august": 8,
+    "aug": 8,
+    "september": 9,
+    "sep": 9,
+    "october": 10,
+    "oct": 10,
+    "november": 11,
+    "nov": 11,
+    "december": 12,
+    "dec": 12,
+}
+
+EVENTS_DATA_PATH = Path(__file__).parent.parent / "data" / "find_events_data.json"
+
+
+@lru_cache(maxsize=1)
+def _read_events_data() -> dict:
+    """Read the events file once per process, precomputing per-event fields.
+
+    Errors propagate instead of being cached, so a failed read is retried.
+    """
+    events_data = orjson.loads(EVENTS_DATA_PATH.read_bytes())
+
+    for city, city_events in events_data.items():
+        for event in city_events:
+            # CRC32 rather than hash() so IDs are stable across processes
+            event_hash = zlib.crc32(event["eventName"].encode()) % 10000
+            event["_id"] = f"EVT_{city}_{event_hash:04d}"
+            event["_from"] = datetime.fromisoformat(event["dateFrom"])
+            event["_to"] = (
+                datetime.fromisoformat(event["dateTo"])
+                if event.get("dateTo")
+                else event["_from"]
+            )
+            # Lowercased once for the event-type filter
+            event["_name_lower"] = event["eventName"].lower()
+            event["_description_lower"] = event["description"].lower()
+
+    return events_data
+
+
+@lru_cache(maxsize=1)
+def _cities_by_lower() -> dict:
+    """Map each lowercased city name to its key in the events data."""
+    return {city.lower(): city for city in _read_events_data()}
+
+
+def _date_matcher(date_filter: str) -> Callable[[dict], bool]:
+    """Build a predicate for the date filter, parsing the filter only once."""
+    date_filter_lower = date_filter.lower()
+    target_month = _MONTH_ALIASES.get(date_filter_lower)
+
+    if target_month is not None:
+        return lambda event: (
+            event["_from"].month == target_month or event["_to"].month == target_month
+        )
+    if "2025" in date_filter_lower:
+        return lambda event: event["_from"].year == 2025 or event["_to"].year == 2025
+
+    # Try exact date match or partial match
+    try:
+        search_date = datetime.fromisoformat(date_filter)
+    except ValueError:
+        search_date = None
+
+    def matches(event: dict) -> bool:
+        if date_filter in event["dateFrom"] or (
+            event.get("dateTo") and date_filter in event["dateTo"]
+        ):
+            return True
+        # If parsing fails, include event for broad search
+        return search_date is None or event["_from"] <= search_date <= event["_to"]
+
+    return matches
+
+
+def _format_event(event: dict, city: str) -> dict:
+    """Convert a raw event to the search result format."""
+    return {
+        "id": event["_id"],
+        "title": event["eventName"],
+        "date_from": event["dateFrom"],
+        "date_to": event.get("dateTo", event["dateFrom"]),
+        "location": city,
+        "description": event["description"],
+        "url": event.get("url", ""),
+    }
+
+
+def _matches_type(event: dict, event_type_lower: str) -> bool:
+    """Check whether an event's name or description mentions the event type."""
+    # The short name is checked first so most matches skip the description scan
+    return (
+        event_type_lower in event["_name_lower"]
+        or event_type_lower in event["_description_lower"]
+    )
+
+
+@lru_cache(maxsize=128)
+def _find_matching_events(
+    location: Optional[str], date: Optional[str], event_type: Optional[str]
+) -> tuple:
+    """Search the cached events data, memoized per set of search arguments.
+
+    Callers must copy the returned events before handing them out.
+    """
+    events_data = _read_events_data()
+
+    if location:
+        # Normalize the location for searching
+        normalized_location = normalize_location(location)
+
+        if normalized_location not in events_data:
+            # Partial matches return every event in the matching cities
+            location_lower = location.lower()
+            return tuple(
+                _format_event(event, city)
+                for city_lower, city in _cities_by_lower().items()
+                if location_lower in city_lower
+                for event in events_data[city]
+            )
+        cities = (normalized_location,)
+    else:
+        # No location specified, search all events
+        cities = events_data.keys()
+
+    matches_date = _date_matcher(date) if date else None
+    event_type_lower = event_type.lower() if event_type else None
+
+    return tuple(
+        _format_event(event, city)
+        for city in cities
+        for event in events_data[city]
+        if (matches_date is None or matches_date(event))
+        and (event_type_lower is None or _matches_type(event, event_type_lower))
+    )
 
 
 class EventSearchRequest(BaseModel):
@@ -35,120 +189,11 @@ class FindEventsTool(BaseTool):
     def _load_events_data(self) -> dict:
         """Load events data from find_events_data.json"""
         try:
-            # Get the path to the data file
-            current_dir = Path(__file__).parent
-            data_file = current_dir.parent / "data" / "find_events_data.json"
-
-            with open(data_file, "r") as f:
-                return json.load(f)
+            return _read_events_data()
         except Exception as e:
             # Return empty dict if file can't be loaded
             return {}
 
-    def _filter_events_by_date(self, events: list, date_filter: str) -> list:
-        """Filter events by date criteria"""
-        if not date_filter:
-            return events
-
-        # Parse common date formats
-        date_filter_lower = date_filter.lower()
-        current_date = datetime.now()
-
-        filtered_events = []
-
-        for event in events:
-            event_date_from = datetime.fromisoformat(event["dateFrom"])
-            event_date_to = (
-                datetime.fromisoformat(event["dateTo"])
-                if event.get("dateTo")
-                else event_date_from
-            )
-
-            # Check various date criteria
-            if date_filter_lower in ["march", "mar"]:
-                if event_date_from.month == 3 or event_date_to.month == 3:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["january", "jan"]:
-                if event_date_from.month == 1 or event_date_to.month == 1:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["february", "feb"]:
-                if event_date_from.month == 2 or event_date_to.month == 2:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["april", "apr"]:
-                if event_date_from.month == 4 or event_date_to.month == 4:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["may"]:
-                if event_date_from.month == 5 or event_date_to.month == 5:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["june", "jun"]:
-                if event_date_from.month == 6 or event_date_to.month == 6:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["july", "jul"]:
-                if event_date_from.month == 7 or event_date_to.month == 7:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["august", "aug"]:
-                if event_date_from.month == 8 or event_date_to.month == 8:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["september", "sep"]:
-                if event_date_from.month == 9 or event_date_to.month == 9:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["october", "oct"]:
-                if event_date_from.month == 10 or event_date_to.month == 10:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["november", "nov"]:
-                if event_date_from.month == 11 or event_date_to.month == 11:
-                    filtered_events.append(event)
-            elif date_filter_lower in ["december", "dec"]:
-                if event_date_from.month == 12 or event_date_to.month == 12:
-                    filtered_events.append(event)
-            elif "2025" in date_filter_lower:
-                if event_date_from.year == 2025 or event_date_to.year == 2025:
-                    filtered_events.append(event)
-            elif date_filter in event["dateFrom"] or (
-                event.get("dateTo") and date_filter in event["dateTo"]
-            ):
-                filtered_events.append(event)
-            else:
-                # Try exact date match or partial match
-                try:
-                    search_date = datetime.fromisoformat(date_filter)
-                    if event_date_from <= search_date <= event_date_to:
-                        filtered_events.append(event)
-                except:
-                    # If parsing fails, include event for broad search
-                    filtered_events.append(event)
-
-        return filtered_events
-
-    def _normalize_location(self, location: str) -> str:
-        """Normalize location name for searching"""
-        if not location:
-            return ""
-
-        location_lower = location.lower()
-
-        # Map common variations to standard city names
-        location_mapping = {
-            "syd": "Sydney",
-            "sydney": "Sydney",
-            "auckland": "Auckland",
-            "auck": "Auckland",
-            "melbourne": "Melbourne",
-            "mel": "Melbourne",
-            "melb": "Melbourne",
-            "brisbane": "Brisbane",
-            "bris": "Brisbane",
-            "perth": "Perth",
-            "adelaide": "Adelaide",
-            "adel": "Adelaide",
-            "wellington": "Wellington",
-            "welly": "Wellington",
-            "wellington nz": "Wellington",
-            "new zealand": "Wellington",
-        }
-
-        return location_mapping.get(location_lower, location.title())
-
     def execute(
         self,
         location: Optional[str] = None,
@@ -173,95 +218,11 @@ class FindEventsTool(BaseTool):
 
             criteria_str = " ".join(criteria) if criteria else "matching your criteria"
 
-            # Search events by location
-            matching_events = []
-
-            if location:
-                # Normalize the location for searching
-                normalized_location = self._normalize_location(location)
-
-                # Search in the specific location
-                if normalized_location in events_data:
-                    location_events = events_data[normalized_location]
-
-                    # Filter by date if specified
-                    if date:
-                        location_events = self._filter_events_by_date(
-                            location_events, date
-                        )
-
-                    # Convert to expected format and add location info
-                    for event in location_events:
-                        formatted_event = {
-                            "id": f"EVT_{normalized_location}_{hash(event['eventName']) % 10000}",
-                            "title": event["eventName"],
-                            "date_from": event["dateFrom"],
-                            "date_to": event.get("dateTo", event["dateFrom"]),
-                            "location": normalized_location,
-                            "description": event["description"],
-                            "url": event.get("url", ""),
-                        }
-
-                        # Filter by event type if specified
-                        if event_type:
-                            event_desc_lower = event["description"].lower()
-                            event_name_lower = event["eventName"].lower()
-                            if (
-                                event_type.lower() in event_desc_lower
-                                or event_type.lower() in event_name_lower
-                            ):
-                                matching_events.append(formatted_event)
-                        else:
-                            matching_events.append(formatted_event)
-
-                else:
-                    # Search across all locations for partial matches
-                    for city, city_events in events_data.items():
-                        if location.lower() in city.lower():
-                            for event in city_events:
-                                formatted_event = {
-                                    "id": f"EVT_{city}_{hash(event['eventName']) % 10000}",
-                                    "title": event["eventName"],
-                                    "date_from": event["dateFrom"],
-                                    "date_to": event.get("dateTo", event["dateFrom"]),
-                                    "location": city,
-                                    "description": event["description"],
-                                    "url": event.get("url", ""),
-                                }
-                                matching_events.append(formatted_event)
-            else:
-                # No location specified, search all events
-                for city, city_events in events_data.items():
-                    city_events_filtered = city_events
-
-                    # Filter by date if specified
-                    if date:
-                        city_events_filtered = self._filter_events_by_date(
-                            city_events_filtered, date
-                        )
-
-                    for event in city_events_filtered:
-                        formatted_event = {
-                            "id": f"EVT_{city}_{hash(event['eventName']) % 10000}",
-                            "title": event["eventName"],
-                            "date_from": event["dateFrom"],
-                            "date_to": event.get("dateTo", event["dateFrom"]),
-                            "location": city,
-                            "description": event["description"],
-                            "url": event.get("url", ""),
-                        }
-
-                        # Filter by event type if specified
-                        if event_type:
-                            event_desc_lower = event["description"].lower()
-                            event_name_lower = event["eventName"].lower()
-                            if (
-                                event_type.lower() in event_desc_lower
-                                or event_type.lower() in event_name_lower
-                            ):
-                                matching_events.append(formatted_event)
-                        else:
-                            matching_events.append(formatted_event)
+            # Copy so callers can't mutate the memoized results
+            matching_events = [
+                dict(event)
+                for event in _find_matching_events(location, date, event_type)
+            ]
 
             return {
                 "events": matching_events,
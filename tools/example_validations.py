@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Any, Dict
 
 from .validators import (
+    MONTH_NAMES,
     FieldType,
     FieldValidator,
     optional_string,
@@ -24,21 +25,7 @@ def find_events_validated(args: Dict[str, Any]) -> Dict[str, Any]:
             "month",
             FieldType.STRING,
             required=True,
-            custom_validator=lambda m: m.capitalize()
-            in [
-                "January",
-                "February",
-                "March",
-                "April",
-                "May",
-                "June",
-                "July",
-                "August",
-                "September",
-                "October",
-                "November",
-                "December",
-            ],
+            custom_validator=lambda m: m.capitalize() in MONTH_NAMES,
             error_message="Invalid month. Please provide a valid month name (e.g., 'January')",
         ),
     ]
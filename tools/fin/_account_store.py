@@ -0,0 +1,43 @@
+"""Cached, indexed access to the customer account data file."""
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import orjson
+
+ACCOUNT_DATA_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "customer_account_data.json"
+)
+
+
+class AccountIndex(NamedTuple):
+    """Accounts indexed for constant-time lookup."""
+
+    by_email: Dict[str, Dict[str, Any]]
+    by_account_id: Dict[str, Dict[str, Any]]
+
+
+@lru_cache(maxsize=1)
+def _read_accounts() -> AccountIndex:
+    """Read and index the account data file once per process.
+
+    Errors such as a missing file propagate and are not cached.
+    """
+    account_list = orjson.loads(ACCOUNT_DATA_PATH.read_bytes())["accounts"]
+
+    by_email: Dict[str, Dict[str, Any]] = {}
+    by_account_id: Dict[str, Dict[str, Any]] = {}
+    for account in account_list:
+        # Keep the first account for a duplicated key, as the old linear scan did
+        by_email.setdefault(account["email"], account)
+        by_account_id.setdefault(account["account_id"], account)
+
+    return AccountIndex(by_email=by_email, by_account_id=by_account_id)
+
+
+def load_accounts() -> Optional[AccountIndex]:
+    """Return the account index, or None if the data file does not exist."""
+    try:
+        return _read_accounts()
+    except FileNotFoundError:
+        return None
@@ -1,54 +1,69 @@
-import json
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-from .validators import FieldType, FieldValidator, optional_string, validate_args
+import orjson
 
+from .validators import (
+    MONTH_NAMES,
+    MONTHS,
+    FieldType,
+    FieldValidator,
+    optional_string,
+    validate_args,
+)
 
-def find_events(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        optional_string("city"),
-        FieldValidator(
-            "month",
-            FieldType.STRING,
-            required=False,
-            default="",
-            custom_validator=lambda m: not m
-            or m.capitalize()
-            in [
-                "January",
-                "February",
-                "March",
-                "April",
-                "May",
-                "June",
-                "July",
-                "August",
-                "September",
-                "October",
-                "November",
-                "December",
-            ],
-            error_message="Invalid month. Please provide a valid month name (e.g., 'January')",
-        ),
-    ]
+EVENTS_DATA_PATH = Path(__file__).resolve().parent / "data" / "find_events_data.json"
+
+
+@lru_cache(maxsize=1)
+def _load_events() -> Dict[str, Any]:
+    """Read the events file once, adding each event's start and end month."""
+    events_data = orjson.loads(EVENTS_DATA_PATH.read_bytes())
+    for events in events_data.values():
+        for event in events:
+            # Dates are fixed-format YYYY-MM-DD, so slice out the month
+            event["_from_month"] = int(event["dateFrom"][5:7])
+            event["_to_month"] = int(event["dateTo"][5:7])
+    return events_data
+
+
+@lru_cache(maxsize=1)
+def _cities_by_lower() -> Dict[str, str]:
+    """Map each lowercased city name to its key in the events data."""
+    return {city.lower(): city for city in _load_events()}
 
+
+# Validation rules, built once at import
+_VALIDATORS = (
+    optional_string("city"),
+    FieldValidator(
+        "month",
+        FieldType.STRING,
+        required=False,
+        default="",
+        custom_validator=lambda m: not m or m.capitalize() in MONTH_NAMES,
+        error_message="Invalid month. Please provide a valid month name (e.g., 'January')",
+    ),
+)
+
+
+def find_events(args: Dict[str, Any]) -> Dict[str, Any]:
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
 
     search_city = validated["city"].lower()
     search_month = validated["month"].capitalize()
 
-    file_path = Path(__file__).resolve().parent / "data" / "find_events_data.json"
-    if not file_path.exists():
+    try:
+        events_data = _load_events()
+    except FileNotFoundError:
         return {"error": "Data file not found."}
 
     if search_month:
-        month_number = datetime.strptime(search_month, "%B").month
+        month_number = MONTHS.index(search_month) + 1
     else:
         return {"error": "Month is required."}
 
@@ -61,23 +76,20 @@ def find_events(args: Dict[str, Any]) -> Dict[str, Any]:
     valid_months = get_adjacent_months(month_number)
 
     matching_events = []
-    for city_name, events in json.load(open(file_path)).items():
-        if search_city and search_city not in city_name.lower():
+    for city_lower, city_name in _cities_by_lower().items():
+        if search_city and search_city not in city_lower:
             continue
 
-        for event in events:
-            date_from = datetime.strptime(event["dateFrom"], "%Y-%m-%d")
-            date_to = datetime.strptime(event["dateTo"], "%Y-%m-%d")
+        for event in events_data[city_name]:
+            from_month = event["_from_month"]
+            to_month = event["_to_month"]
 
             # If the event's start or end month is in our valid months
-            if date_from.month in valid_months or date_to.month in valid_months:
+            if from_month in valid_months or to_month in valid_months:
                 # Add metadata explaining how it matches
-                if date_from.month == month_number or date_to.month == month_number:
+                if from_month == month_number or to_month == month_number:
                     month_context = "requested month"
-                elif (
-                    date_from.month == valid_months[0]
-                    or date_to.month == valid_months[0]
-                ):
+                elif from_month == valid_months[0] or to_month == valid_months[0]:
                     month_context = "previous month"
                 else:
                     month_context = "next month"
@@ -95,6 +107,6 @@ def find_events(args: Dict[str, Any]) -> Dict[str, Any]:
 
     # Add top-level metadata if you wish
     return {
-        "note": f"Returning events from {search_month} plus one month either side (i.e., {', '.join(datetime(2025, m, 1).strftime('%B') for m in valid_months)}).",
+        "note": f"Returning events from {search_month} plus one month either side (i.e., {', '.join(MONTHS[m - 1] for m in valid_months)}).",
         "events": matching_events,
     }
@@ -2,17 +2,17 @@ from typing import Any, Dict
 
 from ..validators import required_date, required_email, validate_args
 
+# Validation rules, built once at import
+_VALIDATORS = (
+    required_email("email"),
+    required_date("start_date"),
+    required_date("end_date"),
+)
 
-def book_pto(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [
-        required_email("email"),
-        required_date("start_date"),
-        required_date("end_date"),
-    ]
 
+def book_pto(args: Dict[str, Any]) -> Dict[str, Any]:
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
 
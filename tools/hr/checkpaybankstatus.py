@@ -2,13 +2,13 @@ from typing import Any, Dict
 
 from ..validators import required_email, validate_args
 
+# Validation rules, built once at import
+_VALIDATORS = (required_email("email"),)
 
-def checkpaybankstatus(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [required_email("email")]
 
+def checkpaybankstatus(args: Dict[str, Any]) -> Dict[str, Any]:
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
 
@@ -1,38 +1,55 @@
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
+import orjson
+
 from ..validators import required_email, validate_args
 
+PTO_DATA_PATH = (
+    Path(__file__).resolve().parent.parent / "data" / "employee_pto_data.json"
+)
+
+
+@lru_cache(maxsize=1)
+def _employees_by_email() -> Dict[str, Dict[str, Any]]:
+    """Read the PTO file once, indexing employees by email.
+
+    Errors such as a missing file propagate and are not cached.
+    """
+    data = orjson.loads(PTO_DATA_PATH.read_bytes())
+    by_email: Dict[str, Dict[str, Any]] = {}
+    for employee in data["theCompany"]["employees"]:
+        # Keep the first employee for a duplicated email, as the old scan did
+        by_email.setdefault(employee["email"], employee)
+    return by_email
 
-def current_pto(args: Dict[str, Any]) -> Dict[str, Any]:
-    # Define validation rules
-    validators = [required_email("email")]
 
+# Validation rules, built once at import
+_VALIDATORS = (required_email("email"),)
+
+
+def current_pto(args: Dict[str, Any]) -> Dict[str, Any]:
     # Validate arguments
-    validated = validate_args(args, validators)
+    validated = validate_args(args, _VALIDATORS)
     if "error" in validated:
         return validated
 
     email = validated["email"]
 
-    file_path = (
-        Path(__file__).resolve().parent.parent / "data" / "employee_pto_data.json"
-    )
-    if not file_path.exists():
+    try:
+        employees = _employees_by_email()
+    except FileNotFoundError:
         return {"error": "Data file not found."}
 
-    data = json.load(open(file_path))
-    employee_list = data["theCompany"]["employees"]
-
-    for employee in employee_list:
-        if employee["email"] == email:
-            num_hours = int(employee["currentPTOHrs"])
-            num_days = float(num_hours / 8)
-            return {
-                "num_hours": num_hours,
-                "num_days": num_days,
-            }
+    employee = employees.get(email)
+    if employee is not None:
+        num_hours = int(employee["currentPTOHrs"])
+        num_days = float(num_hours / 8)
+        return {
+            "num_hours": num_hours,
+            "num_days": num_days,
+        }
 
-    return_msg = "Employee not found with email address " + email
+    return_msg = f"Employee not found with email address {email}"
     return {"error": return_msg}
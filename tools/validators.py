@@ -1,6 +1,24 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+# Full month names in calendar order
+MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+# Accepted by month validators (compare after .capitalize())
+MONTH_NAMES = frozenset(MONTHS)
 
 
 class ValidationError(Exception):
@@ -53,14 +71,14 @@ class FieldValidator:
 
 
 def validate_args(
-    args: Dict[str, Any], validators: List[FieldValidator]
+    args: Dict[str, Any], validators: Sequence[FieldValidator]
 ) -> Dict[str, Any]:
     """
     Validate and parse arguments according to field validators.
 
     Args:
         args: Raw arguments dictionary
-        validators: List of FieldValidator configurations
+        validators: Sequence of FieldValidator configurations
 
     Returns:
         Dict with validated and parsed values